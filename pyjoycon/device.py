@@ -1,13 +1,35 @@
-import hid
 from .constants import JOYCON_VENDOR_ID, JOYCON_PRODUCT_IDS
 from .constants import JOYCON_L_PRODUCT_ID, JOYCON_R_PRODUCT_ID, JOYCON_PRO_PRODUCT_ID
+import time
+
+# how long (in seconds) a hid.enumerate() result is reused by the helpers below
+_ENUMERATE_CACHE_TTL = 0.05
+_enumerate_cache = {}
+
+
+def _enumerate(vendor_id=0, product_id=0):
+    """
+    `hid.enumerate()`, with the result cached for `_ENUMERATE_CACHE_TTL` seconds
+    so that back-to-back lookups like `get_L_id()` + `get_R_id()` share one scan
+    """
+    import hid  # imported lazily to avoid loading the native hid library on import
+
+    key = (vendor_id, product_id)
+    now = time.monotonic()
+    cached = _enumerate_cache.get(key)
+    if cached is not None and now - cached[0] < _ENUMERATE_CACHE_TTL:
+        return cached[1]
+
+    devices = hid.enumerate(vendor_id, product_id)
+    _enumerate_cache[key] = (now, devices)
+    return devices
 
 
 def get_device_ids(debug=False):
     """
     returns a list of tuples like `(vendor_id, product_id, serial_number)`
     """
-    devices = hid.enumerate(0, 0)
+    devices = _enumerate(0, 0)
 
     out = []
     for device in devices:
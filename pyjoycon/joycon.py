@@ -1,12 +1,16 @@
 from .constants import JOYCON_VENDOR_ID, JOYCON_PRODUCT_IDS
 from .constants import JOYCON_L_PRODUCT_ID, JOYCON_R_PRODUCT_ID
-import hid
+import struct
 import time
 import threading
 from typing import Optional
 
 # TODO: disconnect, power off sequence
 
+_INT16LE = struct.Struct('<h')
+# IMU calibration: accel offset, accel coeff, gyro offset, gyro coeff
+_CAL_STRUCT = struct.Struct('<12h')
+
 
 class JoyCon:
     _INPUT_REPORT_SIZE = 49
@@ -51,6 +55,7 @@ class JoyCon:
         self._update_input_report_thread.start()
 
     def _open(self, vendor_id, product_id, serial):
+        import hid  # imported lazily to avoid loading the native hid library on import
         try:
             if hasattr(hid, "device"):  # hidapi
                 _joycon_device = hid.device()
@@ -142,26 +147,9 @@ class JoyCon:
         self.color_body = tuple(color_data[:3])
         self.color_btn  = tuple(color_data[3:])
 
-        self.set_accel_calibration((
-                self._to_int16le_from_2bytes(imu_cal[ 0], imu_cal[ 1]),
-                self._to_int16le_from_2bytes(imu_cal[ 2], imu_cal[ 3]),
-                self._to_int16le_from_2bytes(imu_cal[ 4], imu_cal[ 5]),
-            ), (
-                self._to_int16le_from_2bytes(imu_cal[ 6], imu_cal[ 7]),
-                self._to_int16le_from_2bytes(imu_cal[ 8], imu_cal[ 9]),
-                self._to_int16le_from_2bytes(imu_cal[10], imu_cal[11]),
-            )
-        )
-        self.set_gyro_calibration((
-                self._to_int16le_from_2bytes(imu_cal[12], imu_cal[13]),
-                self._to_int16le_from_2bytes(imu_cal[14], imu_cal[15]),
-                self._to_int16le_from_2bytes(imu_cal[16], imu_cal[17]),
-            ), (
-                self._to_int16le_from_2bytes(imu_cal[18], imu_cal[19]),
-                self._to_int16le_from_2bytes(imu_cal[20], imu_cal[21]),
-                self._to_int16le_from_2bytes(imu_cal[22], imu_cal[23]),
-            )
-        )
+        values = _CAL_STRUCT.unpack_from(imu_cal, 0)
+        self.set_accel_calibration(values[0:3], values[3:6])
+        self.set_gyro_calibration(values[6:9], values[9:12])
 
     def _setup_sensors(self):
         # Enable 6 axis sensors
@@ -171,11 +159,8 @@ class JoyCon:
         # Change format of input report
         self._write_output_report(b'\x01', b'\x03', b'\x30')
 
-    @staticmethod
-    def _to_int16le_from_2bytes(hbytebe, lbytebe):
-        uint16le = (lbytebe << 8) | hbytebe
-        int16le = uint16le if uint16le < 32768 else uint16le - 65536
-        return int16le
+    def _get_int16le_from_input_report(self, offset_byte):
+        return _INT16LE.unpack_from(self._input_report, offset_byte)[0]
 
     def _get_nbit_from_input_report(self, offset_byte, offset_bit, nbit):
         byte = self._input_report[offset_byte]
@@ -310,49 +295,37 @@ class JoyCon:
     def get_accel_x(self, sample_idx=0):
         if sample_idx not in (0, 1, 2):
             raise IndexError('sample_idx should be between 0 and 2')
-        data = self._to_int16le_from_2bytes(
-            self._input_report[13 + sample_idx * 12],
-            self._input_report[14 + sample_idx * 12])
+        data = self._get_int16le_from_input_report(13 + sample_idx * 12)
         return (data - self._ACCEL_OFFSET_X) * self._ACCEL_COEFF_X
 
     def get_accel_y(self, sample_idx=0):
         if sample_idx not in (0, 1, 2):
             raise IndexError('sample_idx should be between 0 and 2')
-        data = self._to_int16le_from_2bytes(
-            self._input_report[15 + sample_idx * 12],
-            self._input_report[16 + sample_idx * 12])
+        data = self._get_int16le_from_input_report(15 + sample_idx * 12)
         return (data - self._ACCEL_OFFSET_Y) * self._ACCEL_COEFF_Y
 
     def get_accel_z(self, sample_idx=0):
         if sample_idx not in (0, 1, 2):
             raise IndexError('sample_idx should be between 0 and 2')
-        data = self._to_int16le_from_2bytes(
-            self._input_report[17 + sample_idx * 12],
-            self._input_report[18 + sample_idx * 12])
+        data = self._get_int16le_from_input_report(17 + sample_idx * 12)
         return (data - self._ACCEL_OFFSET_Z) * self._ACCEL_COEFF_Z
 
     def get_gyro_x(self, sample_idx=0):
         if sample_idx not in (0, 1, 2):
             raise IndexError('sample_idx should be between 0 and 2')
-        data = self._to_int16le_from_2bytes(
-            self._input_report[19 + sample_idx * 12],
-            self._input_report[20 + sample_idx * 12])
+        data = self._get_int16le_from_input_report(19 + sample_idx * 12)
         return (data - self._GYRO_OFFSET_X) * self._GYRO_COEFF_X
 
     def get_gyro_y(self, sample_idx=0):
         if sample_idx not in (0, 1, 2):
             raise IndexError('sample_idx should be between 0 and 2')
-        data = self._to_int16le_from_2bytes(
-            self._input_report[21 + sample_idx * 12],
-            self._input_report[22 + sample_idx * 12])
+        data = self._get_int16le_from_input_report(21 + sample_idx * 12)
         return (data - self._GYRO_OFFSET_Y) * self._GYRO_COEFF_Y
 
     def get_gyro_z(self, sample_idx=0):
         if sample_idx not in (0, 1, 2):
             raise IndexError('sample_idx should be between 0 and 2')
-        data = self._to_int16le_from_2bytes(
-            self._input_report[23 + sample_idx * 12],
-            self._input_report[24 + sample_idx * 12])
+        data = self._get_int16le_from_input_report(23 + sample_idx * 12)
         return (data - self._GYRO_OFFSET_Z) * self._GYRO_COEFF_Z
 
     def get_status(self) -> dict:
@@ -1,21 +1,64 @@
-import hid
+import os
+import queue
+import struct
+import sys
 import time
 import threading
 from typing import Optional
 
+# 输入报告的前25字节: 报告ID和计时器(跳过), 电池, 按键(低16位, 高8位),
+# 左右摇杆各3字节, 振动器状态(跳过), 加速度计x/y/z, 陀螺仪x/y/z
+_INPUT_STRUCT = struct.Struct('<2xBHB6Bx6h')
+# SPI中的IMU校准数据: 加速度计偏移/系数, 陀螺仪偏移/系数
+_CAL_STRUCT = struct.Struct('<12h')
+# 按键名称及其在按键位掩码中的掩码; 位掩码由输入报告第3~5字节按小端序组成,
+# 下表中为各按键在输入报告中的位置(字节序号, 位序号)
+_BUTTON_MASKS = {
+    name: 1 << ((byte_idx - 3) * 8 + bit_idx)
+    for name, byte_idx, bit_idx in (
+        ("a", 3, 3),
+        ("b", 3, 2),
+        ("x", 3, 1),
+        ("y", 3, 0),
+        ("plus", 4, 1),
+        ("minus", 4, 0),
+        ("home", 4, 4),
+        ("capture", 4, 5),
+        ("l", 5, 6),
+        ("zl", 5, 7),
+        ("r", 3, 6),
+        ("zr", 3, 7),
+        ("l-stick", 4, 3),
+        ("r-stick", 4, 2),
+        ("up", 5, 1),
+        ("down", 5, 0),
+        ("left", 5, 3),
+        ("right", 5, 2),
+    )
+}
+
+
 class ProController:
     # Pro Controller特有的常量
     _INPUT_REPORT_SIZE = 49
+    _OUTPUT_REPORT_SIZE = 49
     _INPUT_REPORT_PERIOD = 0.00833  # 1/120秒,对应120Hz IMU采样率
+    _READ_TIMEOUT_MS = 100  # 阻塞读取的超时时间, 超时后可检查停止标志
+    _SUBCMD_TIMEOUT = 1.0  # 等待子命令回复的超时时间(秒)
     _RUMBLE_DATA = b'\x00\x01\x40\x40\x00\x01\x40\x40'
     
     # Pro Controller的SPI内存地址常量
     _SPI_COLOR_DATA_ADDR = 0x6050
+    _SPI_IMU_USER_CAL_MAGIC_ADDR = 0x8026  # 存在用户IMU校准数据时为 b"\xB2\xA1"
     _SPI_IMU_USER_CAL_ADDR = 0x8028
     _SPI_IMU_FACTORY_CAL_ADDR = 0x6020
     _SPI_STICK_CAL_ADDR = 0x603D
+
+    # SPI读取结果缓存, 键为 (产品ID, 序列号, 地址, 大小), 在进程内跨实例和重连共享
+    _spi_cache = {}
     
-    def __init__(self, vendor_id: int, product_id: int, serial: str = None, simple_mode=False):
+    def __init__(self, vendor_id: int, product_id: int, serial: str = None, simple_mode=False,
+                 realtime_priority=False):
         """初始化Pro Controller
         
         Args:
@@ -23,16 +66,45 @@ class ProController:
             product_id: 产品ID 
             serial: 控制器序列号
             simple_mode: 简单模式标志
+            realtime_priority: 在Linux上以实时调度(SCHED_RR)运行更新线程。
+                通过 register_update_hook 注册的回调也在该线程中执行,
+                耗时的回调可能会饿死其他线程, 因此默认关闭
         """
         self.vendor_id = vendor_id
         self.product_id = product_id
         self.serial = serial
         self.simple_mode = simple_mode
+        self._realtime_priority = realtime_priority
         
         # 内部状态
         self._input_hooks = []
-        self._input_report = bytes(self._INPUT_REPORT_SIZE)
+        self._input_report = bytearray(self._INPUT_REPORT_SIZE)
+        self._read_buf = bytearray(self._INPUT_REPORT_SIZE)  # 复用的读取缓冲区
+        self._input_state = self._decode_input_report(self._input_report)
         self._packet_number = 0
+        # 输出报告模板: 命令(1) + 包序号(1) + 振动数据(8) + 子命令(1) + 参数
+        self._output_report = bytearray(self._OUTPUT_REPORT_SIZE)
+        self._output_report[2:10] = self._RUMBLE_DATA
+        self._write_lock = threading.Lock()  # 保护输出报告模板和包序号
+        self._subcmd_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._update_thread = None
+        # 更新线程运行后, 由它转交的子命令回复(0x21), 仅在有调用方等待时转交
+        self._subcmd_queue = queue.SimpleQueue()
+        self._subcmd_waiting = False
+        # get_status() 返回的字典, 只由更新线程在每个报告解析后原地更新
+        self._status = {
+            "battery": {"charging": False, "level": 0},
+            "buttons": dict.fromkeys(_BUTTON_MASKS, False),
+            "analog-sticks": {
+                "left": {"horizontal": 0, "vertical": 0},
+                "right": {"horizontal": 0, "vertical": 0}
+            },
+            "imu": {
+                "accel": {"x": 0, "y": 0, "z": 0},
+                "gyro": {"x": 0, "y": 0, "z": 0}
+            }
+        }
         
         # 初始化校准数据
         self.set_accel_calibration((0, 0, 0), (1, 1, 1))
@@ -40,37 +112,72 @@ class ProController:
         
         # 连接设备
         self._procon_device = self._open_device()
-        self._read_controller_data()
-        self._setup_sensors()
-        
-        # 启动数据更新线程
-        self._update_thread = threading.Thread(target=self._update_input_report)
-        self._update_thread.daemon = True
-        self._update_thread.start()
+        try:
+            self._read_controller_data()
+            self._setup_sensors()
+
+            # 启动数据更新线程; 必须在读取控制器数据和设置传感器之后,
+            # 此前的子命令直接读取设备, 不能与更新线程同时读取
+            self._update_thread = threading.Thread(target=self._update_input_report)
+            self._update_thread.daemon = True
+            self._update_thread.start()
+        except BaseException:
+            # 初始化失败时 with 代码块不会执行, 需要在这里关闭设备
+            self._close()
+            raise
 
     def _open_device(self):
         """打开Pro Controller设备连接"""
+        # 延迟导入, 只导入本模块(如只用到常量)时不必加载HID原生库
+        import hid
+
+        # 设备关闭或断开时读写可能抛出的异常
+        self._hid_errors = (OSError, ValueError) + ((hid.HIDException,) if hasattr(hid, "HIDException") else ())
         try:
             if hasattr(hid, "device"):  # hidapi
                 device = hid.device()
                 device.open(self.vendor_id, self.product_id, self.serial)
+                # 使 read(n, 0) 立即返回, 与 hid 库的 hid_read_timeout(0) 行为一致
+                device.set_nonblocking(1)
             elif hasattr(hid, "Device"):  # hid
                 device = hid.Device(self.vendor_id, self.product_id, self.serial)
             else:
                 raise Exception("Unrecognized HID implementation!")
+            # 缓存绑定方法, 热路径上省去每次的属性查找
+            self._hid_read = device.read
+            self._hid_write = device.write
             return device
         except IOError as e:
             raise IOError('Failed to connect to Pro Controller') from e
 
     def _close(self):
         """关闭设备连接"""
+        self._stop_event.set()
+        update_thread = getattr(self, "_update_thread", None)
+        if update_thread is not None and update_thread is not threading.current_thread():
+            # 等待更新线程退出, 避免关闭设备时线程仍在读取
+            update_thread.join(timeout=2 * self._READ_TIMEOUT_MS / 1000)
         if hasattr(self, "_procon_device"):
             self._procon_device.close()
-            del self._procon_device
+            del self._procon_device, self._hid_read, self._hid_write
+
+    def _read_input_report(self, timeout_ms: int = 0) -> Optional[bytearray]:
+        """读取输入报告
+
+        数据被写入复用的 self._read_buf, 避免每次读取都分配新的 bytes 对象。
+        返回的缓冲区在下一次读取时会被覆盖, 需要保留的数据请自行复制。
 
-    def _read_input_report(self) -> bytes:
-        """读取输入报告"""
-        return bytes(self._procon_device.read(self._INPUT_REPORT_SIZE))
+        Args:
+            timeout_ms: 等待报告的最长时间(毫秒), 为0时不等待
+
+        Returns:
+            读取到的报告, 超时未读到时返回None
+        """
+        data = self._hid_read(self._INPUT_REPORT_SIZE, timeout_ms)
+        if not data:
+            return None
+        self._read_buf[:len(data)] = data
+        return self._read_buf
 
     def _write_output_report(self, command, subcommand, argument):
         """写入输出报告
@@ -80,14 +187,15 @@ class ProController:
             subcommand: 子命令字节
             argument: 参数字节
         """
-        self._procon_device.write(b''.join([
-            command,
-            self._packet_number.to_bytes(1, byteorder='little'),
-            self._RUMBLE_DATA,
-            subcommand,
-            argument,
-        ]))
-        self._packet_number = (self._packet_number + 1) & 0xF
+        size = 11 + len(argument)
+        with self._write_lock:
+            report = self._output_report
+            report[0] = command[0]
+            report[1] = self._packet_number
+            report[10] = subcommand[0]
+            report[11:size] = argument  # 参数超长时模板会随之变长, 不能持有 memoryview
+            self._hid_write(bytes(report[:size]))
+            self._packet_number = (self._packet_number + 1) & 0xF
 
     def _send_subcmd_get_response(self, subcommand, argument) -> (bool, bytes):
         """发送子命令并获取响应
@@ -99,13 +207,34 @@ class ProController:
         Returns:
             (ack, data): 确认标志和响应数据
         """
-        self._write_output_report(b'\x01', subcommand, argument)
-        
-        report = self._read_input_report()
-        while report[0] != 0x21:
-            report = self._read_input_report()
-            
-        return report[13] & 0x80, report[13:]
+        with self._subcmd_lock:  # 同一时间只允许一个子命令等待回复
+            if self._update_thread is not None and self._update_thread.is_alive():
+                # 更新线程独占读取, 回复由它放入队列; 先清掉无人认领的旧回复
+                while not self._subcmd_queue.empty():
+                    self._subcmd_queue.get_nowait()
+                self._subcmd_waiting = True
+                try:
+                    self._write_output_report(b'\x01', subcommand, argument)
+                    deadline = time.monotonic() + self._SUBCMD_TIMEOUT
+                    report = self._subcmd_queue.get(timeout=self._SUBCMD_TIMEOUT)
+                    # 跳过其他子命令(如设置指示灯)迟到的回复
+                    while report[14] != subcommand[0]:
+                        report = self._subcmd_queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    raise IOError("No subcommand reply received") from None
+                finally:
+                    self._subcmd_waiting = False
+            else:
+                self._write_output_report(b'\x01', subcommand, argument)
+                deadline = time.monotonic() + self._SUBCMD_TIMEOUT
+                report = self._read_input_report(self._READ_TIMEOUT_MS)
+                while report is None or report[0] != 0x21 or report[14] != subcommand[0]:
+                    if time.monotonic() >= deadline:
+                        raise IOError("No subcommand reply received")
+                    report = self._read_input_report(self._READ_TIMEOUT_MS)
+
+            # 直接读取时报告位于复用的读取缓冲区, 通过 memoryview 只复制一次需要返回的部分
+            return report[13] & 0x80, bytes(memoryview(report)[13:])
 
     def _spi_flash_read(self, address, size) -> bytes:
         """读取SPI闪存数据
@@ -118,6 +247,11 @@ class ProController:
             读取的数据
         """
         assert size <= 0x1d
+        # 没有序列号时无法区分不同的控制器, 不使用缓存
+        cache_key = (self.product_id, self.serial, address, size) if self.serial else None
+        if cache_key in self._spi_cache:
+            return self._spi_cache[cache_key]
+
         argument = address.to_bytes(4, "little") + size.to_bytes(1, "little")
         ack, report = self._send_subcmd_get_response(b'\x10', argument)
         
@@ -126,39 +260,112 @@ class ProController:
             
         if report[:2] != b'\x90\x10':
             raise IOError("Unexpected response received")
+
+        # 回复中回显了请求的地址和大小; 不一致说明是之前超时请求迟到的回复
+        if report[2:7] != argument:
+            raise IOError(f"SPI read reply does not match address {address:#06x}")
             
-        return report[7:size+7]
+        data = report[7:size+7]
+        if cache_key is not None:
+            self._spi_cache[cache_key] = data
+        return data
+
+    def _raise_thread_priority(self):
+        """提高当前线程的调度优先级, 减少报告接收的延迟抖动
+
+        仅在Linux上有效: 启用 realtime_priority 时优先使用实时调度SCHED_RR,
+        否则或没有权限(CAP_SYS_NICE)时降低nice值; 都失败时保持默认优先级。
+        """
+        if not sys.platform.startswith("linux"):
+            return
+        # Linux上调度策略和nice值都按线程生效, pid为0表示调用线程本身
+        if self._realtime_priority:
+            try:
+                os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(20))
+                return
+            except OSError:
+                pass
+        try:
+            os.setpriority(os.PRIO_PROCESS, 0, -5)
+        except OSError:
+            pass
 
     def _update_input_report(self):
         """更新输入报告的守护线程"""
-        while True:
-            report = self._read_input_report()
-            while report[0] != 0x30:
-                report = self._read_input_report()
-                
-            self._input_report = report
+        self._raise_thread_priority()
+        while not self._stop_event.is_set():
+            updated = False
+            try:
+                report = self._read_input_report(self._READ_TIMEOUT_MS)
+                # 读空系统中积压的报告, 按报告类型分发; 输入报告只保留最新的一个
+                while report is not None:
+                    report_id = report[0]
+                    if report_id == 0x30 or report_id == 0x31:
+                        # 0x31(NFC/IR模式)的前49字节与0x30标准输入报告格式相同
+                        # 交换前后缓冲区, 新报告成为当前输入报告, 旧缓冲区留作下次读取
+                        self._input_report, self._read_buf = report, self._input_report
+                        updated = True
+                    elif report_id == 0x21 and self._subcmd_waiting:
+                        # 子命令回复; 读取缓冲区会被复用, 转交前复制一份
+                        self._subcmd_queue.put(bytes(report))
+                    report = self._read_input_report()
+            except self._hid_errors:
+                break  # 设备已关闭或断开
+            if not updated:
+                continue
+
+            # 每个报告只解析一次, 单次属性赋值保证读取方看到的状态是完整的
+            self._input_state = self._decode_input_report(self._input_report)
+            self._update_status()
             
             for callback in self._input_hooks:
                 callback(self)
 
+    @staticmethod
+    def _decode_input_report(report) -> tuple:
+        """解析输入报告
+
+        Returns:
+            (电池字节, 按键位掩码, 左摇杆(h, v), 右摇杆(h, v), 加速度计(x, y, z), 陀螺仪(x, y, z))
+            其中按键位掩码为报告第3~5字节按小端序组成的整数, IMU为未校准的原始值
+        """
+        # 一次 unpack_from 在C层完成所有字段的解码, 避免逐字节索引和切片
+        (battery, buttons_low, buttons_high,
+         l0, l1, l2, r0, r1, r2,
+         ax, ay, az, gx, gy, gz) = _INPUT_STRUCT.unpack_from(report)
+        return (
+            battery,
+            buttons_low | (buttons_high << 16),
+            (l0 | ((l1 & 0xF) << 8), l1 | ((l2 & 0xF) << 4)),
+            (r0 | ((r1 & 0xF) << 8), r1 | ((r2 & 0xF) << 4)),
+            (ax, ay, az),
+            (gx, gy, gz),
+        )
+
     def _read_controller_data(self):
-        """读取控制器数据(颜色、校准等)"""
-        # 读取颜色数据
-        color_data = self._spi_flash_read(self._SPI_COLOR_DATA_ADDR, 6)
+        """读取控制器数据(颜色、校准等)
+
+        相邻的数据合并为一次SPI读取(每次最多0x1d字节), 以减少子命令往返次数。
+        """
+        # 摇杆校准数据(9字节)和颜色数据(6字节)相距不远, 一次读取
+        color_offset = self._SPI_COLOR_DATA_ADDR - self._SPI_STICK_CAL_ADDR
+        data = self._spi_flash_read(self._SPI_STICK_CAL_ADDR, color_offset + 6)
+        stick_cal = data[:9]
+        color_data = data[color_offset:]
         self.color_body = tuple(color_data[:3])
         self.color_btn = tuple(color_data[3:])
         
-        # 读取IMU校准数据
-        if self._spi_flash_read(0x8026, 2) == b"\xB2\xA1":
-            imu_cal = self._spi_flash_read(self._SPI_IMU_USER_CAL_ADDR, 24)
+        # 读取IMU校准数据; 用户校准标志紧邻用户校准数据, 一次读取
+        data = self._spi_flash_read(self._SPI_IMU_USER_CAL_MAGIC_ADDR, 2 + 24)
+        if data[:2] == b"\xB2\xA1":
+            imu_cal = data[2:]
         else:
             imu_cal = self._spi_flash_read(self._SPI_IMU_FACTORY_CAL_ADDR, 24)
             
         # 设置加速度计和陀螺仪校准
         self._set_imu_calibration(imu_cal)
         
-        # 读取摇杆校准数据
-        stick_cal = self._spi_flash_read(self._SPI_STICK_CAL_ADDR, 9)
+        # 设置摇杆校准
         self._set_stick_calibration(stick_cal)
 
     def _setup_sensors(self):
@@ -172,29 +379,13 @@ class ProController:
 
     def _set_imu_calibration(self, cal_data: bytes):
         """设置IMU校准数据"""
-        def to_int16le(hbyte, lbyte):
-            uint16le = (lbyte << 8) | hbyte
-            return uint16le if uint16le < 32768 else uint16le - 65536
-            
+        values = _CAL_STRUCT.unpack_from(cal_data, 0)
+
         # 设置加速度计校准
-        self.set_accel_calibration(
-            (to_int16le(cal_data[0], cal_data[1]),
-             to_int16le(cal_data[2], cal_data[3]),
-             to_int16le(cal_data[4], cal_data[5])),
-            (to_int16le(cal_data[6], cal_data[7]),
-             to_int16le(cal_data[8], cal_data[9]),
-             to_int16le(cal_data[10], cal_data[11]))
-        )
-        
+        self.set_accel_calibration(values[0:3], values[3:6])
+
         # 设置陀螺仪校准
-        self.set_gyro_calibration(
-            (to_int16le(cal_data[12], cal_data[13]),
-             to_int16le(cal_data[14], cal_data[15]),
-             to_int16le(cal_data[16], cal_data[17])),
-            (to_int16le(cal_data[18], cal_data[19]),
-             to_int16le(cal_data[20], cal_data[21]),
-             to_int16le(cal_data[22], cal_data[23]))
-        )
+        self.set_gyro_calibration(values[6:9], values[9:12])
 
     def _set_stick_calibration(self, cal_data: bytes):
         """设置摇杆校准数据"""
@@ -204,123 +395,69 @@ class ProController:
     def set_gyro_calibration(self, offset_xyz=None, coeff_xyz=None):
         """设置陀螺仪校准参数"""
         if offset_xyz:
-            self._gyro_offset_x, self._gyro_offset_y, self._gyro_offset_z = offset_xyz
+            self._gyro_offsets = tuple(offset_xyz)
         if coeff_xyz:
-            cx, cy, cz = coeff_xyz
-            self._gyro_coeff_x = 0x343b / cx if cx != 0x343b else 1
-            self._gyro_coeff_y = 0x343b / cy if cy != 0x343b else 1
-            self._gyro_coeff_z = 0x343b / cz if cz != 0x343b else 1
+            self._gyro_coeffs = tuple(0x343b / c if c != 0x343b else 1 for c in coeff_xyz)
 
     def set_accel_calibration(self, offset_xyz=None, coeff_xyz=None):
         """设置加速度计校准参数"""
         if offset_xyz:
-            self._accel_offset_x, self._accel_offset_y, self._accel_offset_z = offset_xyz
+            self._accel_offsets = tuple(offset_xyz)
         if coeff_xyz:
-            cx, cy, cz = coeff_xyz
-            self._accel_coeff_x = 0x4000 / cx if cx != 0x4000 else 1
-            self._accel_coeff_y = 0x4000 / cy if cy != 0x4000 else 1
-            self._accel_coeff_z = 0x4000 / cz if cz != 0x4000 else 1
+            self._accel_coeffs = tuple(0x4000 / c if c != 0x4000 else 1 for c in coeff_xyz)
+
+    def register_update_hook(self, callback):
+        """注册输入报告回调
+
+        每收到新的输入报告, 更新线程都会调用 callback(self), 调用方无需轮询 get_status()。
+        回调在更新线程中执行, 应尽快返回, 否则会延迟后续报告的处理;
+        启用 realtime_priority 时回调同样以实时优先级运行。
+
+        Args:
+            callback: 回调函数, 参数为当前的 ProController 实例
 
-    def get_status(self) -> dict:
-        """获取控制器状态
-        
         Returns:
-            包含按键、摇杆、传感器等状态的字典
+            callback 本身, 因此也可以作为装饰器使用
         """
-        return {
-            "battery": {
-                "charging": self._get_battery_charging(),
-                "level": self._get_battery_level()
-            },
-            "buttons": {
-                "a": self._get_button_state(3, 3),
-                "b": self._get_button_state(3, 2),
-                "x": self._get_button_state(3, 1),
-                "y": self._get_button_state(3, 0),
-                "plus": self._get_button_state(4, 1),
-                "minus": self._get_button_state(4, 0),
-                "home": self._get_button_state(4, 4),
-                "capture": self._get_button_state(4, 5),
-                "l": self._get_button_state(5, 6),
-                "zl": self._get_button_state(5, 7),
-                "r": self._get_button_state(3, 6),
-                "zr": self._get_button_state(3, 7),
-                "l-stick": self._get_button_state(4, 3),
-                "r-stick": self._get_button_state(4, 2),
-                "up": self._get_button_state(5, 1),
-                "down": self._get_button_state(5, 0),
-                "left": self._get_button_state(5, 3),
-                "right": self._get_button_state(5, 2),
-            },
-            "analog-sticks": {
-                "left": self._get_left_stick_state(),
-                "right": self._get_right_stick_state()
-            },
-            "imu": {
-                "accel": self._get_accel_state(),
-                "gyro": self._get_gyro_state()
-            }
-        }
+        self._input_hooks.append(callback)
+        return callback
 
-    def _get_button_state(self, byte_idx: int, bit_idx: int) -> bool:
-        """获取按键状态"""
-        return bool(self._input_report[byte_idx] & (1 << bit_idx))
+    def _update_status(self):
+        """用最新的输入报告原地更新状态字典, 仅在更新线程中调用"""
+        battery, buttons, left_stick, right_stick, accel, gyro = self._input_state
+        status = self._status
 
-    def _get_left_stick_state(self) -> dict:
-        """获取左摇杆状态"""
-        return {
-            "horizontal": self._get_stick_value(6, 7, 8),
-            "vertical": self._get_stick_value(7, 8, 4)
-        }
+        battery_status = status["battery"]
+        battery_status["charging"] = bool(battery & 0x10)
+        battery_status["level"] = (battery & 0xE0) >> 5
 
-    def _get_right_stick_state(self) -> dict:
-        """获取右摇杆状态"""
-        return {
-            "horizontal": self._get_stick_value(9, 10, 8),
-            "vertical": self._get_stick_value(10, 11, 4)
-        }
-
-    def _get_stick_value(self, lbyte: int, hbyte: int, shift: int) -> int:
-        """获取摇杆数值"""
-        return self._input_report[lbyte] | ((self._input_report[hbyte] & 0xF) << shift)
+        button_status = status["buttons"]
+        for name, mask in _BUTTON_MASKS.items():
+            button_status[name] = bool(buttons & mask)
 
-    def _get_accel_state(self) -> dict:
-        """获取加速度计状态"""
-        return {
-            "x": self._get_accel_value(0),
-            "y": self._get_accel_value(1),
-            "z": self._get_accel_value(2)
-        }
+        stick_status = status["analog-sticks"]
+        stick_status["left"]["horizontal"], stick_status["left"]["vertical"] = left_stick
+        stick_status["right"]["horizontal"], stick_status["right"]["vertical"] = right_stick
 
-    def _get_gyro_state(self) -> dict:
-        """获取陀螺仪状态"""
-        return {
-            "x": self._get_gyro_value(0),
-            "y": self._get_gyro_value(1),
-            "z": self._get_gyro_value(2)
-        }
+        accel_status = status["imu"]["accel"]
+        gyro_status = status["imu"]["gyro"]
+        for i, axis in enumerate("xyz"):
+            accel_status[axis] = (accel[i] - self._accel_offsets[i]) * self._accel_coeffs[i]
+            gyro_status[axis] = (gyro[i] - self._gyro_offsets[i]) * self._gyro_coeffs[i]
 
-    def _get_accel_value(self, axis: int) -> float:
-        """获取加速度计数值"""
-        offset = 13 + axis * 2
-        raw = int.from_bytes(self._input_report[offset:offset+2], 'little', signed=True)
-        return (raw - getattr(self, f'_accel_offset_{["x","y","z"][axis]}')) * \
-               getattr(self, f'_accel_coeff_{["x","y","z"][axis]}')
+    def get_status(self) -> dict:
+        """获取控制器状态
 
-    def _get_gyro_value(self, axis: int) -> float:
-        """获取陀螺仪数值"""
-        offset = 19 + axis * 2
-        raw = int.from_bytes(self._input_report[offset:offset+2], 'little', signed=True)
-        return (raw - getattr(self, f'_gyro_offset_{["x","y","z"][axis]}')) * \
-               getattr(self, f'_gyro_coeff_{["x","y","z"][axis]}')
+        返回的字典由更新线程在每收到一个输入报告时原地更新并被复用, 调用方不应修改它;
+        在更新钩子之外读取时可能看到更新到一半的状态, 需要保留某一时刻的状态时
+        请在更新钩子中使用 copy.deepcopy 复制。校准数据的修改从下一个报告起生效。
 
-    def _get_battery_charging(self) -> bool:
-        """获取充电状态"""
-        return bool(self._input_report[2] & 0x10)
+        Returns:
+            包含按键、摇杆、传感器等状态的字典
+        """
+        return self._status
 
-    def _get_battery_level(self) -> int:
-        """获取电池电量"""
-        return (self._input_report[2] & 0xE0) >> 5
+    latest_status = property(get_status)
 
     def set_player_lamp(self, pattern: int):
         """设置玩家指示灯
@@ -332,9 +469,17 @@ class ProController:
 
     def disconnect_device(self):
         """断开设备连接"""
-        self._write_output_report(b'\x01', b'\x06', b'\x00')
-        self._close()
+        try:
+            self._write_output_report(b'\x01', b'\x06', b'\x00')
+        finally:
+            # 设备已拔出时写入会失败, 仍需停止更新线程并关闭设备
+            self._close()
 
-    def __del__(self):
-        """析构函数"""
-        self._close()
+    def __enter__(self):
+        """进入 with 代码块, 返回控制器本身"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """退出 with 代码块时断开设备连接"""
+        if hasattr(self, "_procon_device"):
+            self.disconnect_device()
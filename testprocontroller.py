@@ -2,15 +2,14 @@ from pyjoycon.procon import ProController
 from pyjoycon import get_PRO_id
 import time
 
-# 连接Pro Controller
+# 连接Pro Controller, 退出 with 代码块(包括 Ctrl+C)时自动断开
 joycon_id = get_PRO_id()
-procon = ProController(*joycon_id)
+with ProController(*joycon_id) as procon:
 
-# 获取状态
+    # 获取状态: 每收到一个输入报告由更新线程回调输出, 无需轮询
+    @procon.register_update_hook
+    def print_status(controller):
+        print(controller.latest_status)
 
-
-while True:
-    if time.time() % 1 < 0.2:
-        status = procon.get_status()# 每秒的前0.2秒内输出
-        print(status)
-        status = None
+    while True:
+        time.sleep(1)